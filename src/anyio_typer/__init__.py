@@ -1,9 +1,10 @@
 import sys
-from collections.abc import Awaitable, Callable
-from functools import wraps
+from collections.abc import Awaitable, Callable, Mapping
+from functools import lru_cache, update_wrapper
+from inspect import iscoroutine, iscoroutinefunction
+from types import MappingProxyType
 from typing import Any, ParamSpec, TypeVar
 
-import anyio
 from typer import Argument as Argument
 from typer import Context as Context
 from typer import Option as Option
@@ -29,6 +30,18 @@ __author__ = "Vizonex"
 __license__ = "MIT"
 __version__ = "0.2.0"
 
+# typer only ever reads these placeholders so every signature below
+# can share the same ones.
+_DEFAULT_NONE = Default(None)
+_DEFAULT_FALSE = Default(False)
+_DEFAULT_TRUE = Default(True)
+_DEFAULT_OPTIONS_METAVAR = Default("[OPTIONS]")
+
+# Read-only so that they can be shared as defaults without any command
+# being able to change them for the rest.
+_EMPTY_OPTIONS: Mapping[str, Any] = MappingProxyType({})
+_UVLOOP_OPTIONS: Mapping[str, Any] = MappingProxyType({"use_uvloop": True})
+
 # majority of functions were ripped from typer for
 # hacking asyncrhonous code in to inject
 
@@ -38,37 +51,125 @@ __all__ = (
     "Context",
     "Option",
     "run",
+    "run_async",
     "trio_run",
     "uvloop_run",
 )
 
 
+def _trio_run() -> Callable[..., Any] | None:
+    """Imports `trio.run` only once a trio command is actually made"""
+    try:
+        from trio import run
+    except ImportError:
+        # leave it up to anyio to complain about trio when a command runs
+        return None
+    return run
+
+
+def _asyncio_run(options: Mapping[str, Any]) -> Callable[..., Any] | None:
+    """Finds the runner to hand an asyncio command's coroutine to directly
+    or `None` if the options given still need anyio to sort them out"""
+    if not options:
+        from asyncio import run
+
+        return run
+
+    if options.keys() != {"use_uvloop"}:
+        return None
+
+    if not options["use_uvloop"]:
+        from asyncio import run
+
+        return run
+
+    try:
+        # same as anyio, winloop stands in for uvloop on windows
+        if sys.platform == "win32":
+            from winloop import run
+        else:
+            from uvloop import run
+    except ImportError:
+        # leave it up to anyio to complain about uvloop when a command runs
+        return None
+    return run
+
+
+def _runner_call(
+    func: Callable[..., Awaitable[Any]],
+    backend: str,
+    options: Mapping[str, Any],
+) -> tuple[Callable[..., Any], str]:
+    """Picks the runner for a command along with the expression that
+    hands it the command's `coro` in the wrapper `AnyioTyper._wrap`
+    generates"""
+    # asyncio and anyio are only imported once a command needs them so
+    # that importing anyio_typer doesn't pay for either of them.
+    if backend == "asyncio" and iscoroutinefunction(func):
+        run = _asyncio_run(options)
+        if run is not None:
+            # Nothing for anyio to configure, go straight to asyncio.
+            return run, "_run(coro)"
+
+    elif backend == "trio" and not options:
+        run = _trio_run()
+        if run is not None:
+            return run, "_run(_await_coro, coro)"
+
+    from anyio import run
+
+    if not options:
+        # leave backend_options out so anyio has nothing to merge.
+        return run, "_run(_await_coro, coro, backend=_backend)"
+    return run, (
+        "_run(_await_coro, coro, backend=_backend, backend_options=_options)"
+    )
+
+
+async def _await_coro(coro: Awaitable[T]) -> T:
+    """Awaits a command that was already called with the arguments typer
+    parsed for it, so they get bound once on the synchronous side rather
+    than packed up and unpacked again inside of the event loop"""
+    return await coro
+
+
+def _close(coro: Awaitable[Any]) -> None:
+    """Closes a command's coroutine when its runner failed before ever
+    awaiting it, so python doesn't warn about it never being awaited"""
+    if iscoroutine(coro):
+        coro.close()
+
+
 class AnyioTyper(Typer):
     """Typer and Anyio commandline for making asynchronous CLIs"""
 
+    # Harmless placeholder: Typer has no __slots__ so instances keep its
+    # __dict__ either way, this only pays off if Typer ever gains slots.
+    __slots__ = ()
+
     # TODO: Might implement some new items into __init__ hence it's existance.
     def __init__(
         self,
         *,
-        name: str | None = Default(None),
-        cls: type[TyperGroup] | None = Default(None),
-        invoke_without_command: bool = Default(False),
-        no_args_is_help: bool = Default(False),
-        subcommand_metavar: str | None = Default(None),
-        chain: bool = Default(False),
-        result_callback: Callable[..., Any] | None = Default(None),
-        context_settings: dict[Any, Any] | None = Default(None),
-        callback: Callable[..., Any] | None = Default(None),
-        help: str | None = Default(None),
-        epilog: str | None = Default(None),
-        short_help: str | None = Default(None),
-        options_metavar: str = Default("[OPTIONS]"),
-        add_help_option: bool = Default(True),
-        hidden: bool = Default(False),
-        deprecated: bool = Default(False),
+        name: str | None = _DEFAULT_NONE,
+        cls: type[TyperGroup] | None = _DEFAULT_NONE,
+        invoke_without_command: bool = _DEFAULT_FALSE,
+        no_args_is_help: bool = _DEFAULT_FALSE,
+        subcommand_metavar: str | None = _DEFAULT_NONE,
+        chain: bool = _DEFAULT_FALSE,
+        result_callback: Callable[..., Any] | None = _DEFAULT_NONE,
+        context_settings: dict[Any, Any] | None = _DEFAULT_NONE,
+        callback: Callable[..., Any] | None = _DEFAULT_NONE,
+        help: str | None = _DEFAULT_NONE,
+        epilog: str | None = _DEFAULT_NONE,
+        short_help: str | None = _DEFAULT_NONE,
+        options_metavar: str = _DEFAULT_OPTIONS_METAVAR,
+        add_help_option: bool = _DEFAULT_TRUE,
+        hidden: bool = _DEFAULT_FALSE,
+        deprecated: bool = _DEFAULT_FALSE,
         add_completion: bool = True,
         rich_markup_mode: MarkupMode = DEFAULT_MARKUP_MODE,
-        rich_help_panel: str | None = Default(None),
+        rich_help_panel: str | None = _DEFAULT_NONE,
         suggest_commands: bool = True,
         pretty_exceptions_enable: bool = True,
         pretty_exceptions_show_locals: bool = True,
@@ -104,51 +205,77 @@ class AnyioTyper(Typer):
         self,
         func: Callable[P, Awaitable[T]],
         backend: str = "asyncio",
-        options: dict[str, Any] = {},
+        options: Mapping[str, Any] = _EMPTY_OPTIONS,
     ):
         """Used for assistance in wrapping functions
         so that the typer backend can understand how to
         read them. And remeber how to fire each task off.
         """
 
-        @wraps(func)
-        def sync_func(*args: P.args, **kwargs: P.kwargs) -> T:
-            # Depacks Async function and then runs it
-            async def _main(
-                args: tuple[Any, ...], kwargs: dict[str, Any]
-            ) -> T:
-                return await func(*args, **kwargs)
-
-            return anyio.run(
-                _main,
-                args,
-                kwargs,
-                backend=backend,
-                backend_options=options,
-            )
-
-        return sync_func
+        run, call = _runner_call(func, backend, options)
+        # Generated so everything the wrapper needs is a global of its own
+        # namespace rather than a closure cell or a hidden keyword argument
+        # that a command's own parameters could collide with.
+        namespace = {
+            "__name__": __name__,
+            "_run": run,
+            "_await_coro": _await_coro,
+            "_close": _close,
+            "_func": func,
+            "_backend": backend,
+            "_options": options,
+        }
+        code = compile(
+            "def sync_func(*args, **kwargs):\n"
+            "    coro = _func(*args, **kwargs)\n"
+            "    try:\n"
+            f"        return {call}\n"
+            "    except BaseException:\n"
+            "        _close(coro)\n"
+            "        raise\n",
+            "<anyio_typer wrapper for "
+            f"{getattr(func, '__qualname__', repr(func))}>",
+            "exec",
+        )
+        exec(code, namespace)
+        sync_func = namespace["sync_func"]
+
+        # typer only reads these once while registering the command,
+        # so skip merging __dict__ over like functools.wraps would.
+        # Missing ones (partials, callable objects) are skipped.
+        return update_wrapper(
+            sync_func,
+            func,
+            assigned=(
+                "__module__",
+                "__name__",
+                "__qualname__",
+                "__doc__",
+                "__annotations__",
+            ),
+            updated=(),
+        )
 
     def anyio_callback(
         self,
         backend: str = "asyncio",
-        options: dict[str, Any] = {},
+        options: Mapping[str, Any] = _EMPTY_OPTIONS,
         *,
-        cls: type[TyperGroup] | None = Default(None),
-        invoke_without_command: bool = Default(False),
-        no_args_is_help: bool = Default(False),
-        subcommand_metavar: str | None = Default(None),
-        chain: bool = Default(False),
-        result_callback: Callable[..., Any] | None = Default(None),
-        context_settings: dict[Any, Any] | None = Default(None),
-        help: str | None = Default(None),
-        epilog: str | None = Default(None),
-        short_help: str | None = Default(None),
-        options_metavar: str | None = Default(None),
-        add_help_option: bool = Default(True),
-        hidden: bool = Default(False),
-        deprecated: bool = Default(False),
-        rich_help_panel: str | None = Default(None),
+        cls: type[TyperGroup] | None = _DEFAULT_NONE,
+        invoke_without_command: bool = _DEFAULT_FALSE,
+        no_args_is_help: bool = _DEFAULT_FALSE,
+        subcommand_metavar: str | None = _DEFAULT_NONE,
+        chain: bool = _DEFAULT_FALSE,
+        result_callback: Callable[..., Any] | None = _DEFAULT_NONE,
+        context_settings: dict[Any, Any] | None = _DEFAULT_NONE,
+        help: str | None = _DEFAULT_NONE,
+        epilog: str | None = _DEFAULT_NONE,
+        short_help: str | None = _DEFAULT_NONE,
+        options_metavar: str | None = _DEFAULT_NONE,
+        add_help_option: bool = _DEFAULT_TRUE,
+        hidden: bool = _DEFAULT_FALSE,
+        deprecated: bool = _DEFAULT_FALSE,
+        rich_help_panel: str | None = _DEFAULT_NONE,
     ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
         """overrides callback to be fired using anyio instead
 
@@ -158,26 +285,33 @@ class AnyioTyper(Typer):
         to get creative or subclass off `AnyioTyper` if your goal is to make
         that work"""
 
+        callback_kwargs = dict(
+            cls=cls,
+            invoke_without_command=invoke_without_command,
+            no_args_is_help=no_args_is_help,
+            subcommand_metavar=subcommand_metavar,
+            chain=chain,
+            result_callback=result_callback,
+            context_settings=context_settings,
+            help=help,
+            epilog=epilog,
+            short_help=short_help,
+            options_metavar=options_metavar,
+            add_help_option=add_help_option,
+            hidden=hidden,
+            deprecated=deprecated,
+            rich_help_panel=rich_help_panel,
+        )
+
         def decorator(
             async_func: Callable[P, Awaitable[T]],
+            _callback: Callable[..., Any] = self.callback,
+            _wrap: Callable[..., Callable[..., Any]] = self._wrap,
+            _kwargs: dict[str, Any] = callback_kwargs,
+            _backend: str = backend,
+            _options: Mapping[str, Any] = options,
         ) -> Callable[P, Awaitable[T]]:
-            self.callback(
-                cls=cls,
-                invoke_without_command=invoke_without_command,
-                no_args_is_help=no_args_is_help,
-                subcommand_metavar=subcommand_metavar,
-                chain=chain,
-                result_callback=result_callback,
-                context_settings=context_settings,
-                help=help,
-                epilog=epilog,
-                short_help=short_help,
-                options_metavar=options_metavar,
-                add_help_option=add_help_option,
-                hidden=hidden,
-                deprecated=deprecated,
-                rich_help_panel=rich_help_panel,
-            )(self._wrap(async_func, backend=backend, options=options))
+            _callback(**_kwargs)(_wrap(async_func, _backend, _options))
             return async_func
 
         return decorator
@@ -186,7 +320,7 @@ class AnyioTyper(Typer):
         self,
         name: str | None = None,
         backend: str = "asyncio",
-        options: dict[str, Any] = {},
+        options: Mapping[str, Any] = _EMPTY_OPTIONS,
         *,
         cls: type[TyperCommand] | None = None,
         context_settings: dict[Any, Any] | None = None,
@@ -198,7 +332,7 @@ class AnyioTyper(Typer):
         no_args_is_help: bool = False,
         hidden: bool = False,
         deprecated: bool = False,
-        rich_help_panel: str | None = Default(None),
+        rich_help_panel: str | None = _DEFAULT_NONE,
     ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
         """
         Wraps in an asynchronous command to be initiated to run using
@@ -219,7 +353,7 @@ class AnyioTyper(Typer):
         :type backend: str
         :param options: keyword arguments to call the backend
             implementation using documented [here](https://anyio.readthedocs.io/en/stable/basics.html#backend-options)
-        :type options: dict[str, Any]
+        :type options: Mapping[str, Any]
         :param cls: The class of this subcommand. Mainly used when
             [using the Click library underneath](https://typer.tiangolo.com/tutorial/using-click/).
             Can usually be left at the default value `None`.
@@ -280,23 +414,30 @@ class AnyioTyper(Typer):
         :raises LookupError: if the named backend is not found
         """
 
+        command_kwargs = dict(
+            cls=cls,
+            context_settings=context_settings,
+            help=help,
+            epilog=epilog,
+            short_help=short_help,
+            options_metavar=options_metavar,
+            add_help_option=add_help_option,
+            no_args_is_help=no_args_is_help,
+            hidden=hidden,
+            deprecated=deprecated,
+            rich_help_panel=rich_help_panel,
+        )
+
         def decorator(
             async_func: Callable[P, Awaitable[T]],
+            _command: Callable[..., Any] = self.command,
+            _wrap: Callable[..., Callable[..., Any]] = self._wrap,
+            _name: str | None = name,
+            _kwargs: dict[str, Any] = command_kwargs,
+            _backend: str = backend,
+            _options: Mapping[str, Any] = options,
         ) -> Callable[P, Awaitable[T]]:
-            self.command(
-                name,
-                cls=cls,
-                context_settings=context_settings,
-                help=help,
-                epilog=epilog,
-                short_help=short_help,
-                options_metavar=options_metavar,
-                add_help_option=add_help_option,
-                no_args_is_help=no_args_is_help,
-                hidden=hidden,
-                deprecated=deprecated,
-                rich_help_panel=rich_help_panel,
-            )(self._wrap(async_func, backend=backend, options=options))
+            _command(_name, **_kwargs)(_wrap(async_func, _backend, _options))
             return async_func
 
         return decorator
@@ -322,7 +463,7 @@ class AnyioTyper(Typer):
         no_args_is_help: bool = False,
         hidden: bool = False,
         deprecated: bool = False,
-        rich_help_panel: str | None = Default(None),
+        rich_help_panel: str | None = _DEFAULT_NONE,
     ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
         """Helps to configure either uvloop or winloop.
 
@@ -343,11 +484,9 @@ class AnyioTyper(Typer):
 
         """
 
-        return self.anyio_command(
+        command = self.command(
             name,
             cls=cls,
-            backend="asyncio",
-            options={"use_uvloop": True},
             context_settings=context_settings,
             help=help,
             epilog=epilog,
@@ -360,6 +499,17 @@ class AnyioTyper(Typer):
             rich_help_panel=rich_help_panel,
         )
 
+        def decorator(
+            async_func: Callable[P, Awaitable[T]],
+            _command: Callable[..., Any] = command,
+            _wrap: Callable[..., Callable[..., Any]] = self._wrap,
+            _options: Mapping[str, Any] = _UVLOOP_OPTIONS,
+        ) -> Callable[P, Awaitable[T]]:
+            _command(_wrap(async_func, "asyncio", _options))
+            return async_func
+
+        return decorator
+
     @deprecated(
         "Functionality for wrapping Trio is obsolete use\n"
         '`anyio_command(backend="trio")` instead'
@@ -378,7 +528,7 @@ class AnyioTyper(Typer):
         no_args_is_help: bool = False,
         hidden: bool = False,
         deprecated: bool = False,
-        rich_help_panel: str | None = Default(None),
+        rich_help_panel: str | None = _DEFAULT_NONE,
     ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
         """Helps to configure either uvloop or winloop.
 
@@ -398,9 +548,8 @@ class AnyioTyper(Typer):
                 ...
 
         """
-        return self.anyio_command(
+        command = self.command(
             name,
-            backend="trio",
             cls=cls,
             context_settings=context_settings,
             help=help,
@@ -414,16 +563,98 @@ class AnyioTyper(Typer):
             rich_help_panel=rich_help_panel,
         )
 
+        def decorator(
+            async_func: Callable[P, Awaitable[T]],
+            _command: Callable[..., Any] = command,
+            _wrap: Callable[..., Callable[..., Any]] = self._wrap,
+        ) -> Callable[P, Awaitable[T]]:
+            _command(_wrap(async_func, "trio"))
+            return async_func
+
+        return decorator
+
 
 def run(
     function: Callable[..., Awaitable[Any]],
     backend: str = "asyncio",
-    options: dict[str, str] = {},
+    options: Mapping[str, Any] = _EMPTY_OPTIONS,
 ) -> None:
-    """Runs a command asynchronously"""
+    """Runs a command asynchronously, parsing its arguments from the
+    commandline. Use `run_async` when there is nothing to parse."""
+    try:
+        options_key = tuple(sorted(options.items())) if options else ()
+        hash((function, backend, options_key))
+    except TypeError:
+        # unhashable commands or options can't be cached so build a fresh
+        # application for them instead
+        app = _make_app(function, backend, options)
+    else:
+        app = _build_app(function, backend, options_key)
+    app()
+
+
+def _make_app(
+    function: Callable[..., Awaitable[Any]],
+    backend: str,
+    options: Mapping[str, Any],
+) -> AnyioTyper:
     app = AnyioTyper(add_completion=False)
     app.anyio_command(backend=backend, options=options)(function)
-    app()
+    return app
+
+
+@lru_cache(maxsize=32)
+def _build_app(
+    function: Callable[..., Awaitable[Any]],
+    backend: str,
+    options_key: tuple[tuple[str, Any], ...],
+) -> AnyioTyper:
+    """Builds the single command application used by `run` only once
+    for every function, backend and options it gets called with."""
+    return _make_app(function, backend, dict(options_key) or _EMPTY_OPTIONS)
+
+
+def run_async(
+    function: Callable[[], Awaitable[T]],
+    backend: str = "asyncio",
+    options: Mapping[str, Any] = _EMPTY_OPTIONS,
+) -> T:
+    """Runs an asynchronous function on the given backend without building
+    a commandline application around it. Nothing is parsed from the
+    commandline so `function` must not take any arguments.
+
+    :param function: asynchronous function to run
+    :param backend: name of the asynchronous event loop implementation –
+        currently either ``asyncio`` or ``trio``
+    :param options: keyword arguments to call the backend
+        implementation using documented [here](https://anyio.readthedocs.io/en/stable/basics.html#backend-options)
+    :return: whatever `function` returned
+    :raises RuntimeError: if an asynchronous event loop is already running
+        in this thread
+    :raises LookupError: if the named backend is not found
+    """
+    asyncio_run = (
+        _asyncio_run(options)
+        if backend == "asyncio" and iscoroutinefunction(function)
+        else None
+    )
+    if asyncio_run is not None:
+        coro = function()
+        try:
+            return asyncio_run(coro)
+        except BaseException:
+            _close(coro)
+            raise
+
+    trio_run = _trio_run() if backend == "trio" and not options else None
+    if trio_run is not None:
+        return trio_run(function)
+
+    from anyio import run
+
+    if not options:
+        return run(function, backend=backend)
+    return run(function, backend=backend, backend_options=options)
 
 
 @deprecated(
@@ -437,7 +668,7 @@ def uvloop_run(
     """Runs a uvloop/winloop command over a single application.
     if operating system is windows `winloop` is used otherwise use `uvloop`
     """
-    run(function, "asyncio", {"use_uvloop": True})
+    run(function, "asyncio", _UVLOOP_OPTIONS)
 
 
 @deprecated(
@@ -1,12 +1,23 @@
 import asyncio
+import functools
+import gc
 import sys
 import typing
+import warnings
 from enum import Enum
 
 import pytest
+from typer import Typer
 from typer.testing import CliRunner
 
-from anyio_typer import AnyioTyper
+from anyio_typer import (
+    AnyioTyper,
+    _build_app,
+    run,
+    run_async,
+    trio_run,
+    uvloop_run,
+)
 
 
 class User(str, Enum):
@@ -22,6 +33,7 @@ PARAMS = [
         else "asyncio[winloop]",
     ),
     pytest.param(("asyncio", {"use_uvloop": False}), id="asyncio"),
+    pytest.param(("asyncio", {}), id="asyncio[default]"),
     pytest.param(("trio", {}), id="trio"),
 ]
 
@@ -63,3 +75,248 @@ def test_enum_choice(
         app, ["--name", "morty"], catch_exceptions=False
     )
     assert result.exit_code == 0
+
+
+def test_parameter_names_dont_leak_into_wrapper(
+    typer_runner: CliRunner, anyio_backend: tuple[str, dict[str, typing.Any]]
+) -> None:
+    _anyio_name, data = anyio_backend
+
+    app = AnyioTyper()
+
+    @app.anyio_command(backend=_anyio_name, options=data)
+    async def hello(_run: str = "Rick", _options: str = "Morty") -> None:
+        print(f"{_run} and {_options}")
+
+    result = typer_runner.invoke(app, catch_exceptions=False)
+    assert result.exit_code == 0
+    assert result.output == "Rick and Morty\n"
+
+
+def test_run_reuses_application(
+    monkeypatch: pytest.MonkeyPatch,
+    anyio_backend: tuple[str, dict[str, typing.Any]],
+) -> None:
+    _anyio_name, data = anyio_backend
+    calls: list[str] = []
+
+    async def hello(name: str = "Rick") -> None:
+        calls.append(name)
+
+    monkeypatch.setattr(sys, "argv", ["hello", "--name", "Morty"])
+    hits = _build_app.cache_info().hits
+    for _ in range(2):
+        with pytest.raises(SystemExit) as exc_info:
+            run(hello, _anyio_name, data)
+        assert exc_info.value.code == 0
+
+    assert calls == ["Morty", "Morty"]
+    assert _build_app.cache_info().hits == hits + 1
+
+
+class Greeter:
+    """Unhashable command since it defines `__eq__` without `__hash__`"""
+
+    def __init__(self, calls: list[str]) -> None:
+        self.calls = calls
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Greeter) and other.calls == self.calls
+
+    async def __call__(self, name: str = "Rick") -> None:
+        self.calls.append(name)
+
+
+def test_run_unhashable_command(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    monkeypatch.setattr(sys, "argv", ["hello", "--name", "Morty"])
+    with pytest.raises(SystemExit) as exc_info:
+        run(Greeter(calls))
+
+    assert exc_info.value.code == 0
+    assert calls == ["Morty"]
+
+
+def test_partial_and_callable_commands(typer_runner: CliRunner) -> None:
+    async def greet(name: str, punct: str = "!") -> None:
+        print(f"hi {name}{punct}")
+
+    calls: list[str] = []
+    app = AnyioTyper()
+    app.anyio_command("hi")(functools.partial(greet, punct="?"))
+    app.anyio_command("obj")(Greeter(calls))
+
+    result = typer_runner.invoke(app, ["hi", "bob"], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert result.output == "hi bob?\n"
+
+    result = typer_runner.invoke(
+        app, ["obj", "--name", "bob"], catch_exceptions=False
+    )
+    assert result.exit_code == 0
+    assert calls == ["bob"]
+
+
+def test_runs_on_requested_loop(
+    typer_runner: CliRunner, anyio_backend: tuple[str, dict[str, typing.Any]]
+) -> None:
+    _anyio_name, data = anyio_backend
+
+    app = AnyioTyper()
+
+    @app.anyio_command(backend=_anyio_name, options=data)
+    async def loop_name() -> None:
+        if _anyio_name == "trio":
+            import trio
+
+            # raises if this isn't actually running under trio
+            print(trio.lowlevel.current_trio_token())
+        else:
+            print(type(asyncio.get_running_loop()).__module__)
+
+    result = typer_runner.invoke(app, catch_exceptions=False)
+    assert result.exit_code == 0
+    if data.get("use_uvloop"):
+        assert result.output.startswith(
+            "winloop" if sys.platform == "win32" else "uvloop"
+        )
+    elif _anyio_name == "asyncio":
+        assert result.output.startswith("asyncio")
+
+
+def test_run_async(anyio_backend: tuple[str, dict[str, typing.Any]]) -> None:
+    _anyio_name, data = anyio_backend
+
+    async def answer() -> int:
+        return 42
+
+    assert run_async(answer, _anyio_name, data) == 42
+
+
+@pytest.mark.parametrize(
+    "runner", [trio_run, uvloop_run], ids=["trio_run", "uvloop_run"]
+)
+def test_deprecated_run_parses_commandline(
+    monkeypatch: pytest.MonkeyPatch,
+    runner: typing.Callable[..., None],
+) -> None:
+    calls: list[str] = []
+
+    async def hello(name: str, greeting: str = "Hi") -> None:
+        calls.append(f"{greeting} {name}")
+
+    monkeypatch.setattr(sys, "argv", ["hello", "Morty", "--greeting", "Hello"])
+    with pytest.warns(DeprecationWarning), pytest.raises(SystemExit) as exc:
+        runner(hello)
+
+    assert exc.value.code == 0
+    assert calls == ["Hello Morty"]
+
+
+def test_wrapper_keeps_command_identity() -> None:
+    app = AnyioTyper()
+
+    @app.anyio_command()
+    async def hello() -> None:
+        pass
+
+    wrapper = app.registered_commands[0].callback
+    assert wrapper.__module__ == hello.__module__
+    assert wrapper.__wrapped__ is hello
+    assert hello.__qualname__ in wrapper.__code__.co_filename
+
+
+def _never_awaited(caught: list[warnings.WarningMessage]) -> list[str]:
+    return [
+        str(w.message)
+        for w in caught
+        if issubclass(w.category, RuntimeWarning)
+        and "never awaited" in str(w.message)
+    ]
+
+
+def test_failed_runner_closes_coroutine(typer_runner: CliRunner) -> None:
+    app = AnyioTyper()
+
+    @app.anyio_command(backend="nosuch")
+    async def hello() -> None:
+        pass
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        with pytest.raises(LookupError):
+            typer_runner.invoke(app, catch_exceptions=False)
+        gc.collect()
+
+    assert _never_awaited(caught) == []
+
+
+def test_running_loop_closes_coroutine(
+    typer_runner: CliRunner, anyio_backend: tuple[str, dict[str, typing.Any]]
+) -> None:
+    _anyio_name, data = anyio_backend
+    if _anyio_name != "asyncio":
+        pytest.skip("only asyncio refuses to nest inside a running loop")
+
+    app = AnyioTyper()
+
+    @app.anyio_command(backend=_anyio_name, options=data)
+    async def hello() -> None:
+        pass
+
+    async def invoke_app() -> None:
+        typer_runner.invoke(app, catch_exceptions=False)
+
+    async def invoke_run_async() -> None:
+        run_async(hello, _anyio_name, data)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        for nested in (invoke_app, invoke_run_async):
+            with pytest.raises(RuntimeError):
+                asyncio.run(nested())
+        gc.collect()
+
+    assert _never_awaited(caught) == []
+
+
+def test_anyio_callback(
+    typer_runner: CliRunner, anyio_backend: tuple[str, dict[str, typing.Any]]
+) -> None:
+    _anyio_name, data = anyio_backend
+
+    app = AnyioTyper()
+
+    @app.anyio_callback(backend=_anyio_name, options=data)
+    async def main(verbose: bool = False) -> None:
+        print(f"verbose={verbose}")
+
+    @app.anyio_command(backend=_anyio_name, options=data)
+    async def hello(name: str = "Rick") -> None:
+        print(f"Hello {name}!")
+
+    @app.anyio_command(backend=_anyio_name, options=data)
+    async def bye() -> None:
+        print("Bye!")
+
+    result = typer_runner.invoke(
+        app, ["--verbose", "hello", "--name", "Morty"], catch_exceptions=False
+    )
+    assert result.exit_code == 0
+    assert result.output == "verbose=True\nHello Morty!\n"
+
+
+def test_registers_like_typer() -> None:
+    app = AnyioTyper()
+    plain = Typer()
+
+    @app.anyio_command()
+    async def hello() -> None:
+        pass
+
+    @plain.command()
+    def hello_plain() -> None:
+        pass
+
+    assert app.registered_commands[0].cls is plain.registered_commands[0].cls